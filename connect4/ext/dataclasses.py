@@ -16,9 +16,10 @@ that's done below.
 
 import abc
 import dataclasses
+import functools
 import re
-from collections import OrderedDict
 from collections.abc import Callable, Mapping
+from itertools import repeat
 from pathlib import Path
 from types import GenericAlias, NoneType, UnionType
 from typing import Any, List, Self, Union, get_args, get_origin, overload
@@ -31,31 +32,33 @@ from connect4.ext.typing import fully_qualified_type
 from connect4.ext.undefined import UNDEFINED, coalesce_undefined
 
 FieldFilter = Callable[[str, Any], bool]
+FieldConverter = Callable[[Any, bool], Any]
+ValueConverter = Callable[[Any, FieldFilter | None], Any]
 
 _default_field_filter: FieldFilter = lambda _, value: value is not None
 
 
 def _robust_is_subclass(maybe_cls, cls_or_cls_tuple):
-    try:
-        return issubclass(maybe_cls, cls_or_cls_tuple)
-    except TypeError as e:
-        # This is triggered with type alias like typing.Dict
-        if e.args == ("issubclass() arg 1 must be a class",):
-            return False
+    # Type aliases like typing.Dict are not classes and would make `issubclass` raise a TypeError
+    return isinstance(maybe_cls, type) and issubclass(maybe_cls, cls_or_cls_tuple)
 
-        raise
 
+@functools.lru_cache(maxsize=None)
+def _fields_tuple(cls) -> tuple[dataclasses.Field, ...]:
+    # The fields of a dataclass never change after decoration, so they only need to be looked up
+    # once per class.
+    return tuple(dataclasses.fields(cls))
 
-def _robust_is_instance(instance, maybe_subscripted_generic):
-    # Subscripted generics (e.g. typing.List[int] and list[int]) have origins of `list`
-    origin = get_origin(maybe_subscripted_generic)
-    if origin is not None:
-        return isinstance(instance, origin)
 
-    return isinstance(instance, maybe_subscripted_generic)
+@functools.lru_cache(maxsize=None)
+def _fields_by_name(cls) -> dict[str, dataclasses.Field]:
+    return {f.name: f for f in _fields_tuple(cls)}
 
 
 class Replaceable(abc.ABC):
+    # Empty slots let subclasses opt into `__slots__` without regaining a `__dict__`
+    __slots__ = ()
+
     @abc.abstractmethod
     def replace(self: Self, **kwargs) -> Self:
         """
@@ -65,6 +68,8 @@ class Replaceable(abc.ABC):
 
 
 class ReplaceMixin(Replaceable):
+    __slots__ = ()
+
     def replace(self: Self, **kwargs) -> Self:
         if not dataclasses.is_dataclass(self):
             raise TypeError(f"'{fully_qualified_type(self)}' is not a dataclass")
@@ -77,6 +82,8 @@ class ReplaceMixin(Replaceable):
 
 
 class Serializable(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def to_json(self) -> Mapping:
         """
@@ -91,6 +98,8 @@ class Serializable(abc.ABC):
 
 
 class SerializeMixin(Serializable):
+    __slots__ = ()
+
     @classmethod
     def from_json(cls, json_data: Mapping, strict=False) -> Self:
         qualified_type = fully_qualified_type(cls)
@@ -104,18 +113,7 @@ class SerializeMixin(Serializable):
         #
         # Reference
         # https://stackoverflow.com/questions/69090936/how-to-convert-python-string-type-annotation-to-proper-type
-        fields = {x.name: x for x in dataclasses.fields(cls)}
-
-        # Handle any type conversions that are necessary
-        converted = {}
-        for k, v in json_data.items():
-            if k not in fields:
-                if strict:
-                    raise ValueError(f"Field `{k}` is not known for class `{qualified_type}`")
-            else:
-                converted[k] = _build_value(cls, fields[k].type, v, strict)
-
-        return cls(**converted)
+        return _compile_from_json(cls)(json_data, strict)
 
     @overload
     @classmethod
@@ -147,79 +145,174 @@ class SerializeMixin(Serializable):
 
         return cls.from_json(json_value, **kwargs)
 
-    def to_json(self, *, filter_=UNDEFINED) -> Mapping[str, Any]:
+    def to_json(self, *, filter_=UNDEFINED) -> dict[str, Any]:
         qualified_type = fully_qualified_type(self)
         if not dataclasses.is_dataclass(self):
             raise TypeError(f"{qualified_type} is not a dataclass")
 
         field_filter = coalesce_undefined(filter_, _default_field_filter)
 
-        data = _ValueToJSONConverter(filter_=field_filter)
-        fields = dataclasses.fields(self)
-        for field in fields:
+        # The default filter is inlined to avoid calling through a lambda for every field
+        skip_none = field_filter is _default_field_filter
+
+        data = {}
+        for field in _fields_tuple(type(self)):
             key = field.name
             value = getattr(self, key)
-            if field_filter is None or field_filter(key, value):
+            if skip_none:
+                if value is None:
+                    continue
+            elif field_filter is not None and not field_filter(key, value):
+                continue
+
+            # Most leaves are already JSON compatible, so skip the call into `_convert_value`
+            if type(value) in _FAST_TYPES:
                 data[key] = value
+            else:
+                data[key] = _convert_value(value, field_filter)
 
-        return data.dict_
+        return data
 
 
-@dataclasses.dataclass(frozen=True, kw_only=True)
-class _ValueToJSONConverter:
+def _convert_value(value, filter_: FieldFilter | None):
     """
-    Provides a write-only dictionary that converts a value into a json
-    compatible version based on its type. The conversion is restricted to specifically registered
-    converter functions. This is used by `SerializeMixin` to recursively convert values for
-    serialization.
+    Converts a value into a json compatible version based on its type. The conversion is
+    restricted to specifically registered converter functions. This is used by `SerializeMixin` to
+    recursively convert values for serialization.
     """
+    value_type = type(value)
+    if value_type in _FAST_TYPES:
+        return value
 
-    filter_: FieldFilter | None
-    dict_: OrderedDict[str, Any] = dataclasses.field(default_factory=OrderedDict)
+    converter = _find_converter(value_type)
+    if converter is None:
+        return value
 
-    @property
-    def converters(self) -> dict[tuple, Callable[[Self, Any], Any]]:
-        return {
-            (list, tuple): (lambda self, value: [self._convert(v) for v in value]),
-            (set, frozenset): (lambda self, value: [self._convert(v) for v in sorted(value)]),
-            (Serializable,): (lambda self, value: value.to_json(filter_=self.filter_)),
-            (Path,): (lambda _, value: value.as_posix()),
-            (type(re.compile("")),): (lambda _, value: value.pattern),
-        }
+    return converter(value, filter_)
 
-    def __setitem__(self, key, value):
-        self.dict_[key] = self._convert(value)
 
-    def _convert(self, value):
-        if _is_namedtuple_type(type(value)):
-            data = value._asdict()
-            return [self._convert(data[field]) for field in value._fields]
+# Exact types that are already JSON compatible and can skip the converter lookup entirely
+_FAST_TYPES = frozenset({str, int, float, bool, NoneType, dict})
 
-        for type_tuple, converter in self.converters.items():
-            if isinstance(value, type_tuple):
-                return converter(self, value)
 
-        return value
+def _convert_sequence(value, filter_: FieldFilter | None):
+    return [_convert_value(v, filter_) for v in value]
 
 
-def _build_value(cls, target_type, value, strict):
-    if target_type is None or target_type is Any:
+def _convert_set(value, filter_: FieldFilter | None):
+    if len(value) <= 1:
+        # Nothing to order, so skip building the sorted copy
+        return [_convert_value(v, filter_) for v in value]
+
+    # Sort so that the serialized output is deterministic
+    return [_convert_value(v, filter_) for v in sorted(value)]
+
+
+def _convert_serializable(value, filter_: FieldFilter | None):
+    return value.to_json(filter_=filter_)
+
+
+def _convert_path(value, _filter):
+    return value.as_posix()
+
+
+def _convert_regex(value, _filter):
+    return value.pattern
+
+
+_CONVERTER_TABLE: tuple[tuple[tuple[type, ...], ValueConverter], ...] = (
+    ((list, tuple), _convert_sequence),
+    ((set, frozenset), _convert_set),
+    ((Serializable,), _convert_serializable),
+    ((Path,), _convert_path),
+    ((re.Pattern,), _convert_regex),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_converter(value_type) -> ValueConverter | None:
+    """
+    Resolves the converter for a concrete type by walking `_CONVERTER_TABLE` once, so subsequent values
+    of the same type are dispatched with a single cache lookup.
+    """
+    if _is_namedtuple_type(value_type):
+        return _convert_sequence
+
+    for type_tuple, converter in _CONVERTER_TABLE:
+        if issubclass(value_type, type_tuple):
+            return converter
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _field_converters(cls) -> dict[str, FieldConverter]:
+    return {name: _compile_field_converter(f.type) for name, f in _fields_by_name(cls).items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_from_json(cls) -> Callable[[Mapping, bool], Any]:
+    """
+    Generates a `from_json` implementation specialized to the fields of `cls`. Each field is read
+    and converted by straight-line code instead of looping over the JSON data and looking up
+    converters by key.
+
+    The result is cached per class rather than stored on `cls`, so that subclasses don't inherit
+    a function that constructs their parent.
+    """
+    converters = _field_converters(cls)
+    namespace: dict[str, Any] = {
+        "cls": cls,
+        "known_fields": frozenset(converters),
+        "qualified_type": fully_qualified_type(cls),
+    }
+
+    lines = [
+        "def from_json(json_data, strict):",
+        "    if strict:",
+        "        for k in json_data:",
+        "            if k not in known_fields:",
+        "                raise ValueError(f'Field `{k}` is not known for class `{qualified_type}`')",
+        "",
+        "    # Handle any type conversions that are necessary",
+        "    converted = {}",
+    ]
+    for i, (name, converter) in enumerate(converters.items()):
+        namespace[f"convert_{i}"] = converter
+        lines.append(f"    if {name!r} in json_data:")
+        lines.append(f"        converted[{name!r}] = convert_{i}(json_data[{name!r}], strict)")
+
+    lines.append("    return cls(**converted)")
+
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["from_json"]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_field_converter(target_type) -> FieldConverter:
+    """
+    Walks `target_type` once and returns a converter specialized to it, so that deserialization
+    does not need to re-inspect the type for every value.
+    """
+    tag = _classify(target_type)
+
+    if tag == _TAG_ANY:
         # `type` is not specified so value should not be converted
-        pass
-    elif _is_list_type(target_type):
-        # `typing.List` or `list`
+        return _identity
+
+    if tag == _TAG_LIST:
         (element_type,) = get_args(target_type)
-        value = [_build_value(cls, element_type, v, strict) for v in value]
-    elif _is_set_type(target_type):
-        # `typing.Set` or `set`
+        return _build_collection(list, _compile_field_converter(element_type))
+
+    if tag == _TAG_SET:
         (element_type,) = get_args(target_type)
-        value = set(_build_value(cls, element_type, v, strict) for v in value)
-    elif _is_frozenset_type(target_type):
-        # `typing.FrozenSet` or `frozenset`
+        return _build_collection(set, _compile_field_converter(element_type))
+
+    if tag == _TAG_FROZENSET:
         (element_type,) = get_args(target_type)
-        value = frozenset(_build_value(cls, element_type, v, strict) for v in value)
-    elif _is_tuple_type(target_type):
-        # `typing.Tuple` or `tuple`
+        return _build_collection(frozenset, _compile_field_converter(element_type))
+
+    if tag == _TAG_TUPLE:
         element_types = get_args(target_type)
         if (
             len(element_types) == 2
@@ -227,48 +320,158 @@ def _build_value(cls, target_type, value, strict):
             and element_types[1] is Ellipsis
         ):
             # e.g. `tuple[int, ...]`
-            element_types = [element_types[0]] * len(value)
-        elif len(element_types) == len(value):
-            # Heterogenous tuple e.g. `tuple[A, B, C]`
-            pass
-        else:
-            raise ValueError(
-                f"For {target_type = }, expected {len(element_types)} values but found {len(value)}"
-            )
+            return _build_collection(tuple, _compile_field_converter(element_types[0]))
 
-        value = tuple(
-            _build_value(cls, element_type, v, strict)
-            for element_type, v in zip(element_types, value)
+        # Heterogenous tuple e.g. `tuple[A, B, C]`
+        return _build_tuple_hetero(
+            target_type, tuple(_compile_field_converter(t) for t in element_types)
         )
-    elif _is_union_type(target_type):
-        # `typing.Optional` or `X | None`
+
+    if tag == _TAG_UNION:
         possible_types = set(get_args(target_type))
 
         if NoneType in possible_types and len(possible_types) == 2:
-            if value is not None:
-                possible_types.remove(NoneType)
-                actual_type = first(possible_types)
-                value = _build_value(cls, actual_type, value, strict)
-        else:
-            raise ValueError("Deserializing arbitrary Union type is not supported")
-    elif _robust_is_subclass(target_type, SerializeMixin):
-        value = target_type.from_(value, strict=strict)
-    elif isinstance(target_type, EnumTypeWrapper) and isinstance(value, int):
+            possible_types.remove(NoneType)
+            return _build_optional(_compile_field_converter(first(possible_types)))
+
+        return _unsupported_union
+
+    if tag == _TAG_SERIALIZABLE:
+        return _build_serializable(target_type)
+
+    if tag == _TAG_ENUM:
+        return _build_enum_passthrough(_build_cast(target_type))
+
+    return _build_cast(target_type)
+
+
+(
+    _TAG_SCALAR,
+    _TAG_ANY,
+    _TAG_LIST,
+    _TAG_SET,
+    _TAG_FROZENSET,
+    _TAG_TUPLE,
+    _TAG_UNION,
+    _TAG_SERIALIZABLE,
+    _TAG_ENUM,
+) = range(9)
+
+# Origins of subscripted generics, e.g. `typing.List[int]` and `list[int]` both have an origin of
+# `list`
+_GENERIC_ORIGIN_TAGS = {
+    list: _TAG_LIST,
+    set: _TAG_SET,
+    frozenset: _TAG_FROZENSET,
+    tuple: _TAG_TUPLE,
+}
+
+
+def _classify(target_type) -> int:
+    if target_type is None or target_type is Any:
+        return _TAG_ANY
+
+    if _is_union_type(target_type):
+        # `typing.Optional` or `X | None`
+        return _TAG_UNION
+
+    if _is_generic_alias(target_type):
+        tag = _GENERIC_ORIGIN_TAGS.get(get_origin(target_type))
+        if tag is not None:
+            return tag
+
+    if _robust_is_subclass(target_type, SerializeMixin):
+        return _TAG_SERIALIZABLE
+
+    if isinstance(target_type, EnumTypeWrapper):
+        return _TAG_ENUM
+
+    return _TAG_SCALAR
+
+
+def _identity(value, _strict):
+    return value
+
+
+def _build_collection(constructor: Callable, element_converter: FieldConverter) -> FieldConverter:
+    if element_converter is _identity:
+        # e.g. `list[Any]`, where the elements can be consumed as is
+        def _convert_identity(value, _strict):
+            return constructor(value)
+
+        return _convert_identity
+
+    def _convert(value, strict):
+        # `map` avoids running a generator frame per element
+        # pylint: disable=bad-builtin
+        return constructor(map(element_converter, value, repeat(strict)))
+        # pylint: enable=bad-builtin
+
+    return _convert
+
+
+def _build_tuple_hetero(target_type, element_converters: tuple[FieldConverter, ...]):
+    def _convert(value, strict):
+        if len(element_converters) != len(value):
+            raise ValueError(
+                f"For {target_type = }, expected {len(element_converters)} values but found "
+                f"{len(value)}"
+            )
+
+        return tuple(
+            element_converter(v, strict) for element_converter, v in zip(element_converters, value)
+        )
+
+    return _convert
+
+
+def _build_optional(inner_converter: FieldConverter) -> FieldConverter:
+    def _convert(value, strict):
+        return None if value is None else inner_converter(value, strict)
+
+    return _convert
+
+
+def _unsupported_union(_value, _strict):
+    raise ValueError("Deserializing arbitrary Union type is not supported")
+
+
+def _build_serializable(target_type) -> FieldConverter:
+    def _convert(value, strict):
+        return target_type.from_(value, strict=strict)
+
+    return _convert
+
+
+def _build_enum_passthrough(fallback: FieldConverter) -> FieldConverter:
+    def _convert(value, strict):
         # Protobuf enum. We don't want to cast the value because they are passed around as
         # specially typed ints.
-        pass
-    elif _robust_is_instance(value, target_type):
-        # value already conforms to a specific type, e.g. "x" to `str`
-        pass
-    else:
+        if isinstance(value, int):
+            return value
+
+        return fallback(value, strict)
+
+    return _convert
+
+
+def _build_cast(target_type) -> FieldConverter:
+    # Subscripted generics (e.g. typing.Dict[str, int] and dict[str, int]) have origins of `dict`
+    instance_type = get_origin(target_type) or target_type
+
+    def _convert(value, _strict):
+        if isinstance(value, instance_type):
+            # value already conforms to a specific type, e.g. "x" to `str`
+            return value
+
         # Lastly we simply convert the value to the type. This includes
         #  - Primitives like: int, float, str, dict
         #  - collections.OrderedDict
         #  - collections.namedtuple (note, there is no typing information for the fields)
         #  - pathlib.Path
-        value = target_type(value)
+        return target_type(value)
 
-    return value
+    return _convert
 
 
 def _is_generic_alias(target_type):
@@ -309,18 +512,6 @@ def _is_union_type(target_type):
     return is_union_generic_alias or is_new_union_alias
 
 
-def _is_list_type(target_type):
-    return _is_generic_alias(target_type) and get_origin(target_type) is list
-
-
-def _is_set_type(target_type):
-    return _is_generic_alias(target_type) and get_origin(target_type) is set
-
-
-def _is_frozenset_type(target_type):
-    return _is_generic_alias(target_type) and get_origin(target_type) is frozenset
-
-
 def _is_namedtuple_type(target_type):
     bases = getattr(target_type, "__bases__", None)
     if bases is None or bases != (tuple,):
@@ -331,7 +522,3 @@ def _is_namedtuple_type(target_type):
         return False
 
     return True
-
-
-def _is_tuple_type(target_type):
-    return _is_generic_alias(target_type) and get_origin(target_type) is tuple
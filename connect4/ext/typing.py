@@ -1,3 +1,6 @@
+import functools
+
+
 def fully_qualified_type(obj_or_cls):
     if obj_or_cls is None:
         return ""
@@ -6,6 +9,11 @@ def fully_qualified_type(obj_or_cls):
     if not isinstance(obj_or_cls, type):
         class_type = type(obj_or_cls)
 
+    return _qualname_for_class(class_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _qualname_for_class(class_type: type) -> str:
     module_name = class_type.__module__
     qualified_type_name = class_type.__qualname__
     return f"{module_name}.{qualified_type_name}"
@@ -2,6 +2,8 @@ from typing import TypeVar
 
 
 class _Undefined:
+    __slots__ = ()
+
     def __repr__(self):
         return "UNDEFINED"
 
@@ -11,4 +13,5 @@ T = TypeVar("T")
 
 
 def coalesce_undefined(obj: T | _Undefined, default: T) -> T:
-    return obj if not isinstance(obj, _Undefined) else default
+    # `UNDEFINED` is the only instance of `_Undefined`, so an identity check is sufficient
+    return default if obj is UNDEFINED else obj  # pyright: ignore[reportReturnType]
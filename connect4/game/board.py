@@ -1,121 +1,366 @@
+import functools
+import random
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Self, overload
 
-from connect4.ext.dataclasses import SerializeMixin
+from connect4.ext.dataclasses import (
+    SerializeMixin,
+    _convert_value,
+    _default_field_filter,
+    _fields_tuple,
+)
+from connect4.ext.undefined import UNDEFINED, coalesce_undefined
 
-PLAYER1 = "red"
-PLAYER2 = "yellow"
+
+class Player(IntEnum):
+    """
+    The players in turn order. Values start at 1 so that every player is truthy, e.g. a winner.
+    """
+
+    RED = 1
+    YELLOW = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value):
+        # Players used to be serialized by name, e.g. "red", so keep that JSON readable
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+
+        return None
+
+
+PLAYER1 = Player.RED
+PLAYER2 = Player.YELLOW
+
+# Players in turn order. A player's index here is also the index of their bitboard. Indexing a
+# tuple is much cheaper than calling `Player(value)`.
+_PLAYERS = tuple(Player)
 
 
 class IllegalMoveError(Exception):
     pass
 
 
-@dataclass(kw_only=True, frozen=True)
+@functools.lru_cache(maxsize=None)
+def _winning_windows(
+    num_columns: int, num_rows: int, winning_threshold: int
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Enumerates every window of `winning_threshold` cells that could form a win. The result is
+    indexed by bit position and holds the masks of the windows that the piece played in that cell
+    could complete.
+    """
+    stride = num_rows + 1
+    windows_through: list[list[int]] = [[] for _ in range(num_columns * stride)]
+
+    # Vertical, horizontal, and both diagonals
+    for d_col, d_row in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for col in range(num_columns):
+            for row in range(num_rows):
+                end_col = col + d_col * (winning_threshold - 1)
+                end_row = row + d_row * (winning_threshold - 1)
+                if not (0 <= end_col < num_columns and 0 <= end_row < num_rows):
+                    continue
+
+                bits = [
+                    (col + i * d_col) * stride + row + i * d_row for i in range(winning_threshold)
+                ]
+                mask = sum(1 << bit for bit in bits)
+                if d_col == 0:
+                    # Pieces stack, so the cells above a new piece are empty and only the vertical
+                    # window it tops can be completed
+                    windows_through[bits[-1]].append(mask)
+                    continue
+
+                for bit in bits:
+                    windows_through[bit].append(mask)
+
+    return tuple(tuple(windows) for windows in windows_through)
+
+
+@functools.lru_cache(maxsize=None)
+def _zobrist_keys(num_columns: int, num_rows: int) -> tuple[int, ...]:
+    """
+    Random 64-bit keys for Zobrist hashing, one per player per bit position. The key for a piece is
+    at index `player_index * num_bits + bit`. Seeded so that hashes are stable across runs.
+    """
+    rng = random.Random(0)
+    return tuple(rng.getrandbits(64) for _ in range(len(_PLAYERS) * num_columns * (num_rows + 1)))
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class Move(SerializeMixin):
-    player: str
+    player: Player
     column: int
     row: int
 
 
-@dataclass(kw_only=True, frozen=True)
+def _completes_window(windows: tuple[tuple[int, ...], ...], bitboard: int, bit: int) -> bool:
+    """
+    Checks whether `bitboard` fills any of the winning `windows` passing through `bit`.
+    """
+    # Comparing against each window is cheaper in CPython than the shift-and-AND run test on the
+    # four lines through the cell, since most cells are covered by fewer than four windows per
+    # direction and each shift step costs an interpreted loop iteration.
+    # pylint: disable=consider-using-any-or-all
+    for window in windows[bit]:
+        if bitboard & window == window:
+            return True
+    # pylint: enable=consider-using-any-or-all
+
+    return False
+
+
+class _MoveHistory(Sequence[Move]):
+    """
+    Read-only view over the bit indices of played cells that builds `Move` objects on access.
+    Players alternate starting with `PLAYER1`, so the player of each move follows from its index.
+    """
+
+    __slots__ = ("_bits", "_stride")
+
+    def __init__(self, bits: array, stride: int):
+        self._bits = bits
+        self._stride = stride
+
+    def __len__(self):
+        return len(self._bits)
+
+    def __eq__(self, other):
+        # Compares equal to any sequence of the same moves, e.g. the list this view replaced
+        if isinstance(other, _MoveHistory):
+            return self._stride == other._stride and self._bits == other._bits
+
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+    # The viewed moves grow as the game is played, so like a list the view isn't hashable
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def __repr__(self):
+        return repr(self[:])
+
+    @overload
+    def __getitem__(self, index: int) -> Move:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Move]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Move | list[Move]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._bits)))]
+
+        column, row = divmod(self._bits[index], self._stride)
+        if index < 0:
+            index += len(self._bits)
+
+        return Move(player=_PLAYERS[index & 1], column=column, row=row)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class Connect4Board(SerializeMixin):
     num_columns: int = field(default=7)
     num_rows: int = field(default=6)
     winning_threshold: int = field(default=4)
 
     # Game State
-    move_history: list[Move] = field(default_factory=list)
     column_heights: list[int] = field(init=False)
-    game_state: list[list[str]] = field(init=False)
+
+    # Bit index (see `_bitboards`) of each played cell, in the order they were played. Boards compare
+    # by position, so move order isn't part of equality.
+    _moves: array = field(init=False, repr=False, compare=False)
+
+    # One bitboard per player. Cells are stored column-major as bit `column * (num_rows + 1) + row`
+    # where the extra row per column is an always empty sentinel, so that runs of pieces can't wrap
+    # from one column into the next.
+    _bitboards: list[int] = field(init=False, repr=False)
+
+    # Index into `_PLAYERS` of the player whose turn it is
+    _turn: int = field(init=False, repr=False, compare=False)
+
+    # Whether the most recent move won the game, computed once when the move is played
+    _last_move_won: bool = field(init=False, repr=False, compare=False)
+
+    # Winning windows through each cell for this board's shape. See `_winning_windows`.
+    _windows: tuple[tuple[int, ...], ...] = field(init=False, repr=False, compare=False)
+
+    # Zobrist hash of the position, updated as moves are played. See `_zobrist_keys`.
+    _hash: int = field(init=False, repr=False, compare=False)
+    _zobrist: tuple[int, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        object.__setattr__(self, "column_heights", [0 for _ in range(self.num_columns)])
+        object.__setattr__(self, "column_heights", [0] * self.num_columns)
+        object.__setattr__(self, "_bitboards", [0, 0])
+        object.__setattr__(self, "_moves", array("I"))
+        object.__setattr__(self, "_turn", 0)
+        object.__setattr__(self, "_last_move_won", False)
         object.__setattr__(
             self,
-            "game_state",
-            [["" for _ in range(self.num_columns)] for _ in range(self.num_rows)],
+            "_windows",
+            _winning_windows(self.num_columns, self.num_rows, self.winning_threshold),
         )
+        object.__setattr__(self, "_hash", 0)
+        object.__setattr__(self, "_zobrist", _zobrist_keys(self.num_columns, self.num_rows))
+
+    def __hash__(self) -> int:
+        """
+        Hashes the position, so that boards can key a transposition table. The hash changes as moves
+        are played, so store a `clone` rather than a board that is still in play.
+        """
+        return self._hash
+
+    def __repr__(self) -> str:
+        # The generated repr would leave out the pieces, which are held in private fields
+        fields = ", ".join(f"{key}={value!r}" for key, value in self._public_items())
+        return f"{type(self).__qualname__}({fields})"
+
+    @classmethod
+    def from_moves(cls, moves: Iterable[tuple[Player, int]], **kwargs) -> Self:
+        """
+        Creates a board, passing `kwargs` to the constructor, and plays `moves` on it. See
+        `play_many`.
+        """
+        board = cls(**kwargs)
+        board.play_many(moves)
+        return board
+
+    def clone(self) -> Self:
+        """
+        Creates an independent copy of the board, e.g. to explore moves from a shared position.
+        """
+        clone = type(self)(
+            num_columns=self.num_columns,
+            num_rows=self.num_rows,
+            winning_threshold=self.winning_threshold,
+        )
+        object.__setattr__(clone, "column_heights", self.column_heights.copy())
+        object.__setattr__(clone, "_bitboards", self._bitboards.copy())
+        object.__setattr__(clone, "_moves", array(self._moves.typecode, self._moves))
+        object.__setattr__(clone, "_turn", self._turn)
+        object.__setattr__(clone, "_last_move_won", self._last_move_won)
+        object.__setattr__(clone, "_hash", self._hash)
+
+        return clone
+
+    def to_json(self, *, filter_=UNDEFINED) -> dict[str, Any]:
+        field_filter = coalesce_undefined(filter_, _default_field_filter)
+
+        data = {}
+        for key, value in self._public_items():
+            if field_filter is not None and not field_filter(key, value):
+                continue
+
+            data[key] = _convert_value(value, field_filter)
+
+        return data
+
+    def _public_items(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yields the public fields followed by `move_history` and `game_state`. The pieces are held in
+        private fields that aren't JSON compatible, so they are exposed through those views instead.
+        """
+        for f in _fields_tuple(type(self)):
+            if not f.name.startswith("_"):
+                yield f.name, getattr(self, f.name)
+
+        yield "move_history", self.move_history[:]
+        yield "game_state", self.game_state
+
+    @property
+    def game_state(self) -> list[list[Player | None]]:
+        # The grid is only materialized on request; only the occupied cells need to be visited
+        stride = self.num_rows + 1
+        game_state: list[list[Player | None]] = [
+            [None] * self.num_columns for _ in range(self.num_rows)
+        ]
+        for index, bit in enumerate(self._moves):
+            column, row = divmod(bit, stride)
+            game_state[row][column] = _PLAYERS[index & 1]
+
+        return game_state
+
+    @property
+    def move_history(self) -> Sequence[Move]:
+        return _MoveHistory(self._moves, self.num_rows + 1)
 
     @property
     def last_player(self):
-        return PLAYER1 if len(self.move_history) % 2 else PLAYER2
+        return _PLAYERS[self._turn ^ 1]
 
     @property
     def next_player(self):
-        return PLAYER2 if len(self.move_history) % 2 else PLAYER1
-
-    def play(self, player: str, column: int):
-        if player == self.last_player:
-            raise IllegalMoveError(f"It is {self.next_player}'s turn")
+        return _PLAYERS[self._turn]
 
-        row = self.column_heights[column]
-        if row >= self.num_rows:
-            raise IllegalMoveError(f"{column = } is full")
+    def play(self, player: Player, column: int):
+        return self.play_many(((player, column),))[0]
 
-        self.move_history.append(Move(player=player, column=column, row=row))
-        self.game_state[row][column] = player
-        self.column_heights[column] += 1
+    def play_many(self, moves: Iterable[tuple[Player, int]]) -> list[int]:
+        """
+        Plays each `(player, column)` move in order and returns the rows the pieces landed in. Every
+        move is checked for a win, and play stops at the first winning move, so any moves after it
+        are left unplayed. If a move is illegal, the moves before it remain played.
+        """
+        num_rows = self.num_rows
+        stride = num_rows + 1
+        num_bits = self.num_columns * stride
+        column_heights = self.column_heights
+        bitboards = self._bitboards
+        history = self._moves
+        windows = self._windows
+        zobrist = self._zobrist
+        turn = self._turn
+        hash_ = self._hash
 
-        return row
+        rows = []
+        won = False
+        # The state cached on the board must be updated even when a move fails part way through
+        # pylint: disable=too-many-try-statements
+        try:
+            for player, column in moves:
+                if player != _PLAYERS[turn]:
+                    raise IllegalMoveError(f"It is {_PLAYERS[turn]}'s turn")
 
-    def last_move_won(self):
-        if not self.move_history:
-            return False
-
-        def _count_consecutive(player, row, col, d_row, d_col):
-            count = 0
-            while (
-                0 <= row < self.num_rows
-                and 0 <= col < self.num_columns
-                and self.game_state[row][col] == player
-            ):
-                count += 1
-                row += d_row
-                col += d_col
-
-            return count
-
-        last_move = self.move_history[-1]
-
-        # Last move completes a vertical set
-        if (
-            _count_consecutive(last_move.player, last_move.row, last_move.column, -1, 0)
-            >= self.winning_threshold
-        ):
-            return True
+                row = column_heights[column]
+                if row >= num_rows:
+                    raise IllegalMoveError(f"{column = } is full")
 
-        # Last move completes a horizontal set
-        if (
-            _count_consecutive(last_move.player, last_move.row, last_move.column, 0, -1)
-            + _count_consecutive(last_move.player, last_move.row, last_move.column, 0, 1)
-            - 1
-            >= self.winning_threshold
-        ):
-            return True
+                bit = column * stride + row
+                history.append(bit)
+                bitboard = bitboards[turn] | 1 << bit
+                bitboards[turn] = bitboard
+                hash_ ^= zobrist[turn * num_bits + bit]
+                column_heights[column] = row + 1
+                turn ^= 1
+                rows.append(row)
 
-        # Last move completes one diagonal set
-        if (
-            _count_consecutive(last_move.player, last_move.row, last_move.column, -1, -1)
-            + _count_consecutive(last_move.player, last_move.row, last_move.column, 1, 1)
-            - 1
-            >= self.winning_threshold
-        ):
-            return True
+                won = _completes_window(windows, bitboard, bit)
+                if won:
+                    break
+        finally:
+            if rows:
+                object.__setattr__(self, "_turn", turn)
+                object.__setattr__(self, "_hash", hash_)
+                object.__setattr__(self, "_last_move_won", won)
+        # pylint: enable=too-many-try-statements
 
-        # Last move completes a diagonal set
-        if (
-            _count_consecutive(last_move.player, last_move.row, last_move.column, 1, -1)
-            + _count_consecutive(last_move.player, last_move.row, last_move.column, -1, 1)
-            - 1
-            >= self.winning_threshold
-        ):
-            return True
+        return rows
 
-        return False
+    def last_move_won(self):
+        return self._last_move_won
 
     @property
-    def winner(self) -> str | None:
-        if self.last_move_won():
-            return self.move_history[-1].player
+    def winner(self) -> Player | None:
+        if self._last_move_won:
+            return _PLAYERS[self._turn ^ 1]
 
         return None
@@ -75,40 +75,33 @@ def base():
 
 
 @pytest.fixture
-def odict():
-    return OrderedDict(
-        [
-            (
-                "args",
-                OrderedDict(
-                    [
-                        ("primitive_1", 2.0),
-                        ("list_1", [OrderedDict([("x", "a/b/c")])]),
-                        ("list_2", None),
-                        ("opt_1", None),
-                        ("set_1", None),
-                        ("set_2", None),
-                        ("set_3", None),
-                        ("set_4", None),
-                        ("tuple_1", None),
-                        ("tuple_2", None),
-                        ("tuple_3", None),
-                        ("tuple_4", None),
-                        ("tuple_5", None),
-                        ("tuple_6", None),
-                        ("dict_1", None),
-                        ("dict_2", None),
-                        ("dict_3", None),
-                        ("dict_4", None),
-                    ]
-                ),
-            ),
-        ]
-    )
+def json_dict():
+    return {
+        "args": {
+            "primitive_1": 2.0,
+            "list_1": [{"x": "a/b/c"}],
+            "list_2": None,
+            "opt_1": None,
+            "set_1": None,
+            "set_2": None,
+            "set_3": None,
+            "set_4": None,
+            "tuple_1": None,
+            "tuple_2": None,
+            "tuple_3": None,
+            "tuple_4": None,
+            "tuple_5": None,
+            "tuple_6": None,
+            "dict_1": None,
+            "dict_2": None,
+            "dict_3": None,
+            "dict_4": None,
+        },
+    }
 
 
 def test_serialize_mixin_to_json(  # pylint: disable=redefined-outer-name
-    base: Base, odict: OrderedDict
+    base: Base, json_dict: dict
 ):
     assert isinstance(base.args.list_1[0].x, Path)
     assert (
@@ -116,7 +109,7 @@ def test_serialize_mixin_to_json(  # pylint: disable=redefined-outer-name
     ), "By default, all null values should be stripped from the output"
 
     assert json.dumps(base.to_json(filter_=None)) == json.dumps(
-        odict
+        json_dict
     ), "Specifying a null filter should result in all fields serializing"
 
     # List
@@ -275,3 +268,18 @@ def test_serialize_mixin_from_(base: Base):  # pylint: disable=redefined-outer-n
     assert (
         Extension.from_(NotSerializable(base.args)) == extension
     ), "`from_` should be able to accept objects that are not Serializable."
+
+
+def test_serialize_mixin_from_json_strict():
+    @dataclass
+    class Point(SerializeMixin):
+        x: int
+        y: int = 0
+
+    assert Point.from_json({"x": 1, "z": 2}) == Point(x=1), "Unknown fields are ignored by default"
+    assert Point.from_json({"x": 1}, strict=True) == Point(x=1)
+
+    with pytest.raises(ValueError) as ctx:
+        Point.from_json({"x": 1, "z": 2}, strict=True)
+
+    assert ctx.match("Field `z` is not known"), "Unknown fields should be rejected when strict"
@@ -1,15 +1,28 @@
+import itertools
+import json
 from collections.abc import Sequence
+from dataclasses import dataclass
 
 import pytest
 
-from connect4.game.board import PLAYER1, PLAYER2, Connect4Board, IllegalMoveError, Move
+from connect4.game.board import (
+    PLAYER1,
+    PLAYER2,
+    Connect4Board,
+    IllegalMoveError,
+    Move,
+    Player,
+)
 
 
 def _test_game_state(board: Connect4Board, move: Move, should_win: bool = False):
-    assert board.last_move_won() == should_win
-    assert board.winner is None if not should_win else board.winner == move.player
-    assert board.last_player == move.player
-    assert board.next_player != move.player
+    player = move.player
+    expected_winner = player if should_win else None
+
+    assert board.last_move_won() is should_win
+    assert board.winner == expected_winner
+    assert board.last_player is player
+    assert board.next_player is not player
     assert board.move_history[-1] == move
 
 
@@ -26,7 +39,7 @@ def test_connect4_errors():
     # Player 2 can't go when it is Player 1's move
     with pytest.raises(IllegalMoveError) as ctx:
         board.play(PLAYER2, 0)
-    assert ctx.match(f"It is {PLAYER1}'s turn")
+    assert f"It is {PLAYER1}'s turn" in str(ctx.value)
 
     # Insert a token for PLAYER1 at column 0, we expect the token to fall at row 0.
     board.play(PLAYER1, 0)
@@ -35,57 +48,110 @@ def test_connect4_errors():
     # Player 1 can't go when it is Player 2's move
     with pytest.raises(IllegalMoveError) as ctx:
         board.play(PLAYER1, 0)
-    assert ctx.match(f"It is {PLAYER2}'s turn")
+    assert f"It is {PLAYER2}'s turn" in str(ctx.value)
 
 
 # NOTE: inputs are in (col, expected_row) order
-CONNECT4_TEST_CASES = {  # pylint: disable=consider-using-namedtuple-or-dataclass
-    "no_moves": ([], False),
-    "one_move": ([(0, 0)], False),
+CONNECT4_TEST_CASES = (
+    ("no_moves", (), False),
+    ("one_move", ((0, 0),), False),
     # Player 1 wins horizontally
-    "horizontal_win": ([(0, 0), (0, 1), (1, 0), (0, 2), (2, 0), (0, 3), (3, 0)], True),
+    ("horizontal_win", ((0, 0), (0, 1), (1, 0), (0, 2), (2, 0), (0, 3), (3, 0)), True),
     # Player 2 wins vertically
-    "vertical_win": ([(0, 0), (0, 1), (1, 0), (0, 2), (2, 0), (0, 3), (4, 0), (0, 4)], True),
-    # Player 2 wins across diagonal going from upper left to lower right
-    "negative_diagonal_win": (
-        # fmt: off
-        [
-            (0, 0), (1, 0), (2, 0), (3, 0),
-            (3, 1), (2, 1), (1, 1), (0, 1),
-            (0, 2), (1, 2), (2, 2), (3, 2),
-            (1, 3), (0, 3),
-        ],
-        # fmt: on
-        True,
-    ),
-    # Player 1 wins across diagonal going from lower left to upper right
-    "positive_diagonal_win": (
-        # fmt: off
-        [
-            (0, 0), (1, 0), (2, 0), (3, 0),
-            (3, 1), (2, 1), (1, 1), (0, 1),
-            (0, 2), (1, 2), (2, 2), (3, 2),
-            (3, 3),
-        ],
-        # fmt: on
-        True,
-    ),
-}
-
-CONNECT4_TEST_CASE_IDS = list(CONNECT4_TEST_CASES.keys())
-CONNECT4_TEST_ARG_VALUES = list(CONNECT4_TEST_CASES[k] for k in CONNECT4_TEST_CASE_IDS)
+    ("vertical_win", ((0, 0), (0, 1), (1, 0), (0, 2), (2, 0), (0, 3), (4, 0), (0, 4)), True),
+)
 
+CONNECT4_TEST_CASE_IDS = [case[0] for case in CONNECT4_TEST_CASES]
+CONNECT4_TEST_ARG_VALUES = [(case[1], case[2]) for case in CONNECT4_TEST_CASES]
 
-@pytest.mark.parametrize(
-    argnames=["move_set", "last_move_should_win"],
-    ids=CONNECT4_TEST_CASE_IDS,
-    argvalues=CONNECT4_TEST_ARG_VALUES,
-)
-def test_connect4_win_conditions(move_set: Sequence[tuple[int, int]], last_move_should_win: bool):
+
+def test_connect4_players():
+    assert str(PLAYER1) == "red"
+    assert str(PLAYER2) == "yellow"
+    assert all(Player), "Players should be truthy so `if board.winner` works for either player"
+
+    # Players are IntEnums, so their plain values are accepted too
     board = Connect4Board()
-    next_player = PLAYER1
+    board.play(int(PLAYER1), 0)
+    assert board.last_player is PLAYER1
+    with pytest.raises(IllegalMoveError) as ctx:
+        board.play(int(PLAYER1), 0)
+    assert f"It is {PLAYER2}'s turn" in str(ctx.value)
+
+    board = Connect4Board()
+    board.play(PLAYER1, 3)
+    move = board.move_history[0]
+    assert Move.from_json(json.loads(json.dumps(move.to_json()))).player is PLAYER1
+
+    # Players were serialized by name before they were ints
+    assert Move.from_json({"player": "red", "column": 1, "row": 0}) == Move(
+        player=PLAYER1, column=1, row=0
+    )
+    assert Move.from_json({"player": "yellow", "column": 1, "row": 1}).player is PLAYER2
+    with pytest.raises(ValueError):
+        Move.from_json({"player": "green", "column": 1, "row": 0})
+
+
+def test_connect4_to_json():
+    board = Connect4Board()
+    board.play(PLAYER1, 3)
+    board.play(PLAYER2, 3)
+
+    json_data = json.loads(json.dumps(board.to_json()))
+    assert [Move.from_json(move) for move in json_data["move_history"]] == board.move_history
+    assert json_data["column_heights"] == board.column_heights
+    assert json_data["game_state"] == board.game_state, "The position should be serialized"
+    assert json_data["game_state"][1][3] == PLAYER2
+    assert f"move_history={board.move_history!r}" in repr(board)
+    assert f"game_state={board.game_state!r}" in repr(board)
+
+    seen = {}
+
+    def _record(key, value):
+        seen[key] = value
+        return key != "game_state"
+
+    assert "game_state" not in board.to_json(filter_=_record)
+    assert seen["move_history"] == board.move_history, "Filters should see `Move` objects"
+
+    @dataclass(kw_only=True, frozen=True, slots=True)
+    class NamedBoard(Connect4Board):
+        name: str = "practice"
+
+    assert NamedBoard().to_json()["name"] == "practice", "New fields should be serialized"
+
+
+def test_connect4_move_history():
+    board = Connect4Board()
+    assert board.move_history == []  # pylint: disable=use-implicit-booleaness-not-comparison
+
+    board.play(PLAYER1, 3)
+    board.play(PLAYER2, 4)
+    moves = [Move(player=PLAYER1, column=3, row=0), Move(player=PLAYER2, column=4, row=0)]
+    assert board.move_history == moves
+    assert board.move_history != moves[:1]
+    assert board.move_history == board.clone().move_history
+    assert repr(board.move_history) == repr(moves)
+
+
+def test_connect4_slots():
+    # Boards are created in bulk when exploring positions, so they shouldn't carry a `__dict__`
+    board = Connect4Board()
+    board.play(PLAYER1, 0)
+    assert not hasattr(board, "__dict__")
+    assert not hasattr(board.move_history, "__dict__")
+    assert not hasattr(board.move_history[0], "__dict__")
+
+
+def _play_moves(
+    board: Connect4Board,
+    move_set: Sequence[tuple[int, int]],
+    last_move_should_win: bool = False,
+):
+    players = itertools.cycle((PLAYER1, PLAYER2))
 
     for i, move in enumerate(move_set):
+        next_player = next(players)
         input_col = move[0]
         expected_row = move[1]
 
@@ -98,6 +164,114 @@ def test_connect4_win_conditions(move_set: Sequence[tuple[int, int]], last_move_
         else:
             _test_game_state(board, expected_move, should_win=False)
 
-        next_player = PLAYER2 if next_player is PLAYER1 else PLAYER1
+
+@pytest.mark.parametrize(
+    argnames=["move_set", "last_move_should_win"],
+    ids=CONNECT4_TEST_CASE_IDS,
+    argvalues=CONNECT4_TEST_ARG_VALUES,
+)
+def test_connect4_win_conditions(move_set: Sequence[tuple[int, int]], last_move_should_win: bool):
+    board = Connect4Board()
+    _play_moves(board, move_set, last_move_should_win)
+
+    assert board.last_move_won() == last_move_should_win
+
+
+# Moves shared by the diagonal win cases, in (col, expected_row) order
+DIAGONAL_PREFIX = [
+    # fmt: off
+    (0, 0), (1, 0), (2, 0), (3, 0),
+    (3, 1), (2, 1), (1, 1), (0, 1),
+    (0, 2), (1, 2), (2, 2), (3, 2),
+    # fmt: on
+]
+
+
+@pytest.fixture(scope="session")
+def diagonal_prefix_board():
+    board = Connect4Board()
+    _play_moves(board, DIAGONAL_PREFIX)
+    return board
+
+
+def test_connect4_play_many():
+    board = Connect4Board()
+    assert board.play_many([(PLAYER1, 0), (PLAYER2, 0), (PLAYER1, 1)]) == [0, 1, 0]
+    _test_game_state(board, Move(player=PLAYER1, column=1, row=0))
+
+    # Moves before an illegal one are kept
+    with pytest.raises(IllegalMoveError):
+        board.play_many([(PLAYER2, 1), (PLAYER2, 2)])
+    _test_game_state(board, Move(player=PLAYER2, column=1, row=1))
+
+    board.play_many([(PLAYER1, 2), (PLAYER2, 2), (PLAYER1, 3)])
+    assert board.last_move_won(), "The final move of a batch should be checked for a win"
+    assert board.winner is PLAYER1
+
+
+def test_connect4_from_moves():
+    board = Connect4Board()
+    _play_moves(board, DIAGONAL_PREFIX)
+
+    # Playing the same moves as one batch should reach the same position
+    players = itertools.cycle((PLAYER1, PLAYER2))
+    batched = Connect4Board.from_moves((next(players), col) for col, _ in DIAGONAL_PREFIX)
+    assert batched == board
+    assert batched.move_history == board.move_history
+    assert not batched.last_move_won()
+
+
+def test_connect4_play_many_stops_at_win():
+    board = Connect4Board()
+    moves = [(PLAYER1, 0), (PLAYER2, 1)] * 4 + [(PLAYER1, 2)]
+
+    # Player 1 completes a vertical four on the 7th move, so the rest of the batch isn't played
+    assert board.play_many(moves) == [0, 0, 1, 1, 2, 2, 3]
+    _test_game_state(board, Move(player=PLAYER1, column=0, row=3), should_win=True)
+    assert len(board.move_history) == 7
+
+
+@pytest.mark.parametrize(
+    argnames=["move_set", "last_move_should_win"],
+    ids=["negative_diagonal_win", "positive_diagonal_win"],
+    argvalues=[
+        # Player 2 wins across diagonal going from upper left to lower right
+        ([(1, 3), (0, 3)], True),
+        # Player 1 wins across diagonal going from lower left to upper right
+        ([(3, 3)], True),
+    ],
+)
+def test_connect4_diagonal_win_conditions(
+    diagonal_prefix_board: Connect4Board,  # pylint: disable=redefined-outer-name
+    move_set: Sequence[tuple[int, int]],
+    last_move_should_win: bool,
+):
+    board = diagonal_prefix_board.clone()
+    _play_moves(board, move_set, last_move_should_win)
 
     assert board.last_move_won() == last_move_should_win
+    assert len(diagonal_prefix_board.move_history) == len(
+        DIAGONAL_PREFIX
+    ), "Playing on a clone should not modify the original board"
+
+
+def test_connect4_hash():
+    board = Connect4Board()
+    empty_hash = hash(board)
+
+    board.play(PLAYER1, 0)
+    board.play(PLAYER2, 1)
+    board.play(PLAYER1, 2)
+    assert hash(board) != empty_hash
+
+    # Transpositions reach the same position, so they hash and compare equal
+    transposed = Connect4Board.from_moves([(PLAYER1, 2), (PLAYER2, 1), (PLAYER1, 0)])
+    assert hash(transposed) == hash(board)
+    assert transposed == board
+    assert {board.clone(): True}[transposed]
+
+    # Swapping which player holds the cells gives a different position
+    position = Connect4Board.from_moves([(PLAYER1, 0), (PLAYER2, 1)])
+    swapped = Connect4Board.from_moves([(PLAYER1, 1), (PLAYER2, 0)])
+    assert hash(swapped) != hash(position)
+    assert swapped != position